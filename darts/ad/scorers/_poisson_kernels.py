@@ -0,0 +1,91 @@
+"""
+Poisson NLL kernels
+-------------------
+
+Compiled kernels used by the :class:`PoissonNLLScorer`. Numba and NumExpr are optional dependencies; the scorer uses
+the Numba kernel when ``NUMBA_AVAILABLE``, otherwise the NumExpr expression when ``NUMEXPR_AVAILABLE``, and falls back
+to its NumPy implementation when neither is installed.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE = False
+
+try:
+    import numexpr as ne
+
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# log(n!) for all n < _LOG_FACT_TABLE_SIZE, larger counts use Stirling's series
+_LOG_FACT_TABLE_SIZE = 256
+_LOG_FACT_TABLE = np.array(
+    [math.lgamma(i + 1) for i in range(_LOG_FACT_TABLE_SIZE)], dtype=np.float64
+)
+
+_HALF_LOG_2PI = 0.5 * math.log(2.0 * math.pi)
+
+# lower bound of the estimated rates, so that `log(mu)` stays finite when all prediction samples are 0
+_MU_MIN = 1e-300
+
+
+def _stirling_lgamma(x):
+    """Stirling's series for log(Gamma(x)). Accurate to double precision for x > `_LOG_FACT_TABLE_SIZE`."""
+    inv_x = 1.0 / x
+    inv_x2 = inv_x * inv_x
+    return (
+        (x - 0.5) * math.log(x)
+        - x
+        + _HALF_LOG_2PI
+        + inv_x * (1.0 / 12.0 - inv_x2 * (1.0 / 360.0 - inv_x2 / 1260.0))
+    )
+
+
+def _poisson_nll(vals, pred_vals, out):
+    """Writes the Poisson negative log-likelihood of the counts `vals` into `out`, with the rate of each time step
+    estimated as the mean of the samples in `pred_vals`. `vals` and `out` have shape (time_steps,), `pred_vals` has
+    shape (time_steps, samples). `vals` must be an integer array with non-negative values. The rates are clamped to
+    `_MU_MIN`.
+    """
+    n_samples = pred_vals.shape[1]
+    for i in prange(vals.shape[0]):
+        # the rate is reduced in the same pass, so that `pred_vals` is only read once
+        s = 0.0
+        for j in range(n_samples):
+            s += pred_vals[i, j]
+        mu = max(s / n_samples, _MU_MIN)
+
+        n = vals[i]
+        if n < _LOG_FACT_TABLE_SIZE:
+            log_fact = _LOG_FACT_TABLE[n]
+        else:
+            log_fact = _stirling_lgamma(n + 1.0)
+        if n == 0:
+            # n * log(mu) is 0 for n == 0
+            out[i] = mu
+        else:
+            out[i] = mu - n * math.log(mu) + log_fact
+
+
+if NUMBA_AVAILABLE:
+    _stirling_lgamma = njit(fastmath=True, cache=True)(_stirling_lgamma)
+    _poisson_nll_numba = njit(parallel=True, fastmath=True, cache=True)(_poisson_nll)
+
+
+def _poisson_nll_numexpr(vals, mu, log_fact):
+    """Poisson negative log-likelihood of the counts `vals` given the rates `mu` and the log-factorials `log_fact`
+    of the counts, evaluated in a single pass with NumExpr's vectorized (VML when available) `log`.
+    """
+    return ne.evaluate(
+        "mu - where(v > 0, v * log(mu), 0.0) + lf",
+        local_dict={"v": vals, "mu": mu, "lf": log_fact},
+    )
@@ -6,17 +6,36 @@ Poisson distribution negative log-likelihood Scorer.
 
 The anomaly score is the negative log likelihood of the actual series values
 under a Poisson distribution estimated from the stochastic prediction.
+The actual series must contain counts, i.e. non-negative integer values.
 """
 
 import numpy as np
-from scipy.stats import poisson
+from scipy.special import gammaln, xlogy
 
+from darts.ad.scorers._poisson_kernels import (
+    _MU_MIN,
+    NUMBA_AVAILABLE,
+    NUMEXPR_AVAILABLE,
+    _poisson_nll_numexpr,
+)
 from darts.ad.scorers.scorers import NLLScorer
+from darts.logging import get_logger, raise_if_not
+
+if NUMBA_AVAILABLE:
+    from darts.ad.scorers._poisson_kernels import _poisson_nll_numba
+
+logger = get_logger(__name__)
+
+# largest count for which the log-factorials are tabulated on the scorer, larger counts are evaluated directly
+_LOG_FACT_CACHE_MAX = 2**20
 
 
 class PoissonNLLScorer(NLLScorer):
     def __init__(self, window: int = 1) -> None:
         super().__init__(window=window)
+        # log-factorial table reused across calls, grown on demand to the largest count seen
+        self._log_fact_cache = None
+        self._log_fact_max = -1
 
     def __str__(self):
         return "PoissonNLLScorer"
@@ -26,6 +45,53 @@ class PoissonNLLScorer(NLLScorer):
         deterministic_values: np.ndarray,
         probabilistic_estimations: np.ndarray,
     ) -> np.ndarray:
+        """`deterministic_values` must be non-negative integers. They are cast once to `int64`, so that the
+        log-factorials can be looked up by index instead of being evaluated for each value. Missing (NaN) values are
+        allowed and give NaN scores.
+
+        The rate of each time step is the mean of the prediction samples, clamped to at least `1e-300`. This keeps the
+        scores finite (large instead of infinite) when all the samples are 0 and the actual value is positive.
+        """
+        vals = np.asarray(deterministic_values)
+        missing = np.isnan(vals)
+        observed = vals[~missing]
+        raise_if_not(
+            np.all(np.isfinite(observed))
+            and np.all(observed >= 0)
+            and np.array_equal(np.floor(observed), observed),
+            "`PoissonNLLScorer` expects the actual series to contain non-negative integer values.",
+            logger=logger,
+        )
+        # missing values are scored as 0 counts, and their scores are replaced with NaN at the end
+        vals_int = np.where(missing, 0, vals).astype(np.int64)
+
+        if NUMBA_AVAILABLE:
+            # single fused pass computing the rates and the log-likelihoods, with tabulated log-factorials
+            scores = np.empty(vals_int.shape, dtype=np.float64)
+            _poisson_nll_numba(vals_int, probabilistic_estimations, scores)
+        else:
+            mu = np.maximum(
+                np.mean(probabilistic_estimations, axis=1, dtype=np.float64), _MU_MIN
+            )
+            log_fact = self._log_factorial(vals_int)
+            if NUMEXPR_AVAILABLE:
+                scores = _poisson_nll_numexpr(vals_int, mu, log_fact)
+            else:
+                # log pmf computed directly with ufuncs, avoiding the overhead of `scipy.stats.poisson.logpmf`;
+                # `xlogy` returns 0 for `vals_int == 0`
+                scores = -(xlogy(vals_int, mu) - mu - log_fact)
+
+        scores[missing] = np.nan
+        return scores
 
-        mu = np.mean(probabilistic_estimations, axis=1)
-        return -poisson.logpmf(deterministic_values, mu=mu)
+    def _log_factorial(self, vals: np.ndarray) -> np.ndarray:
+        """Returns log(vals!) by gathering from the cached log-factorial table, which only has to be recomputed
+        when `vals` contains a count larger than all previously seen counts.
+        """
+        max_val = int(vals.max()) if vals.size else 0
+        if max_val > _LOG_FACT_CACHE_MAX:
+            return gammaln(vals + 1.0)
+        if max_val > self._log_fact_max:
+            self._log_fact_cache = gammaln(np.arange(1, max_val + 2, dtype=np.float64))
+            self._log_fact_max = max_val
+        return self._log_fact_cache[vals]
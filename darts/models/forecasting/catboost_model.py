@@ -7,19 +7,43 @@ CatBoost based regression model.
 This implementation comes with the ability to produce probabilistic forecasts.
 """
 
+import os
+import tempfile
 from typing import List, Optional, Sequence, Tuple, Union
 
+import catboost
 import numpy as np
 from catboost import CatBoostRegressor
-import onnxmltools
-from onnxmltools.convert.common.data_types import FloatTensorType
+from joblib import Parallel, cpu_count, delayed
 
-from darts.logging import get_logger, raise_log
+from darts.logging import get_logger, raise_if_not, raise_log
 from darts.models.forecasting.regression_model import RegressionModel, _LikelihoodMixin
 from darts.timeseries import TimeSeries
+from darts.utils.multioutput import MultiOutputRegressor
 
 logger = get_logger(__name__)
 
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+# Check whether we are running catboost >= 1.2.0 for the MultiQuantile loss
+tokens = catboost.__version__.split(".")
+cb_120_or_above = (int(tokens[0]), int(tokens[1])) >= (1, 2)
+
+
+def _fit_one_quantile(
+    quantile_model,
+    training_samples: np.ndarray,
+    training_labels: np.ndarray,
+    fit_kwargs: dict,
+):
+    """Fits `quantile_model` on the training data shared by all quantiles. Runs in a worker process, and returns
+    the fitted quantile model.
+    """
+    return quantile_model.fit(training_samples, training_labels, **fit_kwargs)
+
 
 class CatBoostModel(RegressionModel, _LikelihoodMixin):
     def __init__(
@@ -34,6 +58,9 @@ class CatBoostModel(RegressionModel, _LikelihoodMixin):
         random_state: Optional[int] = None,
         multi_models: Optional[bool] = True,
         use_static_covariates: bool = True,
+        multi_quantile: bool = True,
+        predict_task_type: Optional[str] = None,
+        use_onnx_for_predict: bool = False,
         **kwargs,
     ):
         """CatBoost Model
@@ -90,7 +117,9 @@ class CatBoostModel(RegressionModel, _LikelihoodMixin):
             and variance couple, which capture data (aleatoric) uncertainty.
             This will overwrite any `objective` parameter.
         quantiles
-            Fit the model to these quantiles if the `likelihood` is set to `quantile`.
+            Fit the model to these quantiles if the `likelihood` is set to `quantile`. With CatBoost >= 1.2 and
+            `multi_quantile=True`, a single model is fitted to all the quantiles jointly using CatBoost's
+            'MultiQuantile' loss function. Otherwise, one model is fitted per quantile.
         random_state
             Control the randomness in the fitting procedure and for sampling.
             Default: ``None``.
@@ -101,8 +130,23 @@ class CatBoostModel(RegressionModel, _LikelihoodMixin):
             Whether the model should use static covariate information in case the input `series` passed to ``fit()``
             contain static covariates. If ``True``, and static covariates are available at fitting time, will enforce
             that all target `series` have the same static covariate dimensionality in ``fit()`` and ``predict()``.
+        multi_quantile
+            Whether to fit a single model to all the `quantiles` using CatBoost's 'MultiQuantile' loss function, if
+            `likelihood` is set to `quantile`. Requires CatBoost >= 1.2, otherwise one model is fitted per quantile.
+            Set to ``False`` to fit one independent model per quantile. Default: ``True``.
+        predict_task_type
+            The processing unit type to use for prediction, one of 'CPU' or 'GPU'. If ``None``, predictions run on
+            the same processing unit as the training, given by the CatBoost `task_type` parameter in `kwargs`.
+            Default: ``None``.
+        use_onnx_for_predict
+            Whether to run the predictions of the fitted model with ONNX Runtime instead of CatBoost. The fitted
+            estimators are converted to ONNX upon the first prediction after each call to ``fit()``. Requires the
+            `onnxruntime` package, and is only supported for deterministic models (`likelihood=None`).
+            Default: ``False``.
         **kwargs
-            Additional keyword arguments passed to `catboost.CatBoostRegressor`.
+            Additional keyword arguments passed to `catboost.CatBoostRegressor`. Unless `thread_count` is given,
+            CatBoost uses as many threads as there are physical CPU cores (instead of CatBoost's default of all logical
+            cores, as hyper-threads on the same core compete for its execution units when training trees).
 
         Examples
         --------
@@ -133,18 +177,53 @@ class CatBoostModel(RegressionModel, _LikelihoodMixin):
                [1006.22355514],
                [1006.21607546]])
         """
-        kwargs["random_state"] = random_state  # seed for tree learner
-        self.kwargs = kwargs
+        self.kwargs = {
+            **kwargs,
+            "random_state": random_state,  # seed for tree learner
+            # suppress writing catboost info files when user does not specifically ask to
+            "allow_writing_files": kwargs.get("allow_writing_files", False),
+            "thread_count": kwargs.get(
+                "thread_count", cpu_count(only_physical_cores=True)
+            ),
+        }
         self._median_idx = None
         self._model_container = None
+        self._quantile_loss_functions = None
         self._rng = None
         self.likelihood = likelihood
         self.quantiles = None
+        self._multi_quantile = False
+
+        if predict_task_type is None:
+            predict_task_type = "GPU" if kwargs.get("task_type") == "GPU" else "CPU"
+        raise_if_not(
+            predict_task_type in ["CPU", "GPU"],
+            f"`predict_task_type` must be one of ['CPU', 'GPU'], received: {predict_task_type}.",
+            logger=logger,
+        )
+        self._predict_task_type = predict_task_type
+
+        if use_onnx_for_predict:
+            raise_if_not(
+                likelihood is None,
+                "`use_onnx_for_predict=True` is only supported for deterministic models (`likelihood=None`).",
+                logger=logger,
+            )
+            if ort is None:
+                raise_log(
+                    ImportError(
+                        "`use_onnx_for_predict=True` requires the `onnxruntime` package to be installed."
+                    ),
+                    logger=logger,
+                )
+        self.use_onnx_for_predict = use_onnx_for_predict
+        self._ort_sessions = None
 
         self._output_chunk_length = output_chunk_length
 
         likelihood_map = {
-            "quantile": None,
+            # the alpha of each quantile model is set in `fit()`
+            "quantile": "Quantile",
             "poisson": "Poisson",
             "gaussian": "RMSEWithUncertainty",
             "RMSEWithUncertainty": "RMSEWithUncertainty",
@@ -156,16 +235,29 @@ class CatBoostModel(RegressionModel, _LikelihoodMixin):
             self._check_likelihood(likelihood, available_likelihoods)
             self._rng = np.random.default_rng(seed=random_state)  # seed for sampling
 
+            self.kwargs["loss_function"] = likelihood_map[likelihood]
+
             if likelihood == "quantile":
                 self.quantiles, self._median_idx = self._prepare_quantiles(quantiles)
-                self._model_container = self._get_model_container()
-
-            else:
-                self.kwargs["loss_function"] = likelihood_map[likelihood]
-
-        # suppress writing catboost info files when user does not specifically ask to
-        if "allow_writing_files" not in kwargs:
-            kwargs["allow_writing_files"] = False
+                # a single model fitting all the quantiles jointly, if supported
+                self._multi_quantile = (
+                    multi_quantile and cb_120_or_above and len(self.quantiles) > 1
+                )
+                if self._multi_quantile:
+                    alphas = ",".join(str(quantile) for quantile in self.quantiles)
+                    self.kwargs["loss_function"] = f"MultiQuantile:alpha={alphas}"
+                else:
+                    # fitted quantile models, indexed by the position of the quantile in `self.quantiles`
+                    self._model_container = [None] * len(self.quantiles)
+                    # catboost loss of each quantile model, formatted once instead of on every `fit()`
+                    self._quantile_loss_functions = [
+                        f"Quantile:alpha={quantile}" for quantile in self.quantiles
+                    ]
+
+        # the regressor is only built once; when fitting one model per quantile it stays unfitted and serves as the
+        # base model of which each quantile model is a copy
+        model = CatBoostRegressor(**self.kwargs)
+        self._base_model = model if self._model_container is not None else None
 
         super().__init__(
             lags=lags,
@@ -174,7 +266,7 @@ class CatBoostModel(RegressionModel, _LikelihoodMixin):
             output_chunk_length=output_chunk_length,
             add_encoders=add_encoders,
             multi_models=multi_models,
-            model=CatBoostRegressor(**kwargs),
+            model=model,
             use_static_covariates=use_static_covariates,
         )
 
@@ -220,6 +312,9 @@ class CatBoostModel(RegressionModel, _LikelihoodMixin):
             Additional kwargs passed to `catboost.CatboostRegressor.fit()`
         """
 
+        # ONNX Runtime sessions of a previous fit are outdated
+        self._ort_sessions = None
+
         if val_series is not None:
             kwargs["eval_set"] = self._create_lagged_data(
                 target_series=val_series,
@@ -228,27 +323,11 @@ class CatBoostModel(RegressionModel, _LikelihoodMixin):
                 max_samples_per_ts=max_samples_per_ts,
             )
 
-        if self.likelihood == "quantile":
+        if self._model_container is not None:
             # empty model container in case of multiple calls to fit, e.g. when backtesting
-            self._model_container.clear()
-            for quantile in self.quantiles:
-                this_quantile = str(quantile)
-                # translating to catboost argument
-                self.kwargs["loss_function"] = f"Quantile:alpha={this_quantile}"
-                self.model = CatBoostRegressor(**self.kwargs)
-
-                super().fit(
-                    series=series,
-                    past_covariates=past_covariates,
-                    future_covariates=future_covariates,
-                    max_samples_per_ts=max_samples_per_ts,
-                    verbose=verbose,
-                    **kwargs,
-                )
-
-                self._model_container[quantile] = self.model
-
-            return self
+            self._model_container[:] = [None] * len(self.quantiles)
+            # each quantile model is an (unfitted) copy of the base model, made in `_fit_model()`
+            self.model = self._base_model
 
         super().fit(
             series=series,
@@ -261,6 +340,97 @@ class CatBoostModel(RegressionModel, _LikelihoodMixin):
 
         return self
 
+    def _fit_model(
+        self,
+        target_series: Sequence[TimeSeries],
+        past_covariates: Sequence[TimeSeries],
+        future_covariates: Sequence[TimeSeries],
+        max_samples_per_ts: int,
+        **kwargs,
+    ):
+        """
+        Override of RegressionModel's method to fit the quantile models in parallel, one process per quantile.
+        """
+        if self._model_container is None:
+            super()._fit_model(
+                target_series=target_series,
+                past_covariates=past_covariates,
+                future_covariates=future_covariates,
+                max_samples_per_ts=max_samples_per_ts,
+                **kwargs,
+            )
+            return
+
+        # joblib's count respects the CPU affinity and cgroup limits of the process
+        n_cpus = cpu_count()
+        n_jobs = max(1, min(len(self.quantiles), n_cpus // 2))
+        # split catboost's threads among the processes to avoid oversubscription
+        thread_count = self.kwargs.get("thread_count", -1)
+        thread_count = max(
+            1, (n_cpus if thread_count == -1 else thread_count) // n_jobs
+        )
+
+        # the lagged data is only created once, and shared by all the quantile models
+        training_samples, training_labels = self._create_lagged_data(
+            target_series,
+            past_covariates,
+            future_covariates,
+            max_samples_per_ts,
+        )
+        # if training_labels is of shape (n_samples, 1) flatten it to shape (n_samples,)
+        if len(training_labels.shape) == 2 and training_labels.shape[1] == 1:
+            training_labels = training_labels.ravel()
+
+        fitted = Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(_fit_one_quantile)(
+                self._get_quantile_model(loss_function, thread_count),
+                training_samples,
+                training_labels,
+                kwargs,
+            )
+            for loss_function in self._quantile_loss_functions
+        )
+        for idx, model in enumerate(fitted):
+            self._model_container[idx] = model
+
+        # as with a sequential fit, the last quantile model is kept as `self.model`
+        self.model = fitted[-1]
+        self._set_lagged_feature_names(
+            target_series, past_covariates, future_covariates
+        )
+
+    def _get_quantile_model(self, loss_function: str, thread_count: int):
+        """Returns an unfitted copy of the base model (wrapped in a `MultiOutputRegressor` if the base model is),
+        fitting the quantile of the given catboost `loss_function`.
+        """
+        wrapped = isinstance(self.model, MultiOutputRegressor)
+        model = (self.model.estimator if wrapped else self.model).copy()
+        model.set_params(loss_function=loss_function, thread_count=thread_count)
+        if wrapped:
+            model = MultiOutputRegressor(model, n_jobs=self.model.n_jobs)
+        return model
+
+    def _create_lagged_data(
+        self,
+        target_series: Sequence[TimeSeries],
+        past_covariates: Sequence[TimeSeries],
+        future_covariates: Sequence[TimeSeries],
+        max_samples_per_ts: int,
+    ):
+        """Override of RegressionModel's method, returning the features as a column-major `float32` array and the
+        labels as `float32`, which is the layout CatBoost ingests without an internal copy and conversion.
+        """
+        training_samples, training_labels = super()._create_lagged_data(
+            target_series=target_series,
+            past_covariates=past_covariates,
+            future_covariates=future_covariates,
+            max_samples_per_ts=max_samples_per_ts,
+        )
+        return (
+            np.asfortranarray(training_samples, dtype=np.float32),
+            np.asarray(training_labels, dtype=np.float32),
+        )
+
     def _predict_and_sample(
         self,
         x: np.ndarray,
@@ -269,6 +439,12 @@ class CatBoostModel(RegressionModel, _LikelihoodMixin):
         **kwargs,
     ) -> np.ndarray:
         """Override of RegressionModel's method to allow for the probabilistic case"""
+        if self.use_onnx_for_predict:
+            return self._predict_onnx(x)
+
+        x = np.asfortranarray(x, dtype=np.float32)
+        if self._predict_task_type == "GPU":
+            kwargs.setdefault("task_type", self._predict_task_type)
         if self.likelihood in ["gaussian", "RMSEWithUncertainty"]:
             return self._predict_and_sample_likelihood(
                 x, num_samples, "normal", predict_likelihood_parameters, **kwargs
@@ -282,6 +458,114 @@ class CatBoostModel(RegressionModel, _LikelihoodMixin):
                 x, num_samples, predict_likelihood_parameters, **kwargs
             )
 
+    def _predict_onnx(self, x: np.ndarray) -> np.ndarray:
+        """Deterministic prediction with ONNX Runtime, one session per fitted CatBoost estimator."""
+        if self._ort_sessions is None:
+            self._ort_sessions = self._create_ort_sessions()
+
+        x = np.ascontiguousarray(x, dtype=np.float32)
+        k = x.shape[0]
+        # each estimator predicts a single output, concatenated in the order of `MultiOutputRegressor.predict()`
+        prediction = np.concatenate(
+            [
+                sess.run(None, {sess.get_inputs()[0].name: x})[0].reshape(k, -1)
+                for sess in self._ort_sessions
+            ],
+            axis=1,
+        ).astype(np.float64)
+        return prediction.reshape(k, self.pred_dim, -1)
+
+    def _create_ort_sessions(self) -> list:
+        """Converts the fitted CatBoost estimators to ONNX and loads them into ONNX Runtime inference sessions."""
+        estimators = self._fitted_estimators()
+
+        sess_options = ort.SessionOptions()
+        sess_options.graph_optimization_level = (
+            ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        # errors only; the tree ensemble's declared output shape triggers a harmless warning on every run
+        sess_options.log_severity_level = 3
+        # each session has its own thread pool; the sessions run one after the other, so the pools share the
+        # physical cores (as for training, hyper-threads compete for the same execution units) and their idle
+        # threads must not spin
+        sess_options.intra_op_num_threads = max(
+            1, cpu_count(only_physical_cores=True) // len(estimators)
+        )
+        sess_options.add_session_config_entry("session.intra_op.allow_spinning", "0")
+
+        sessions = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for idx, estimator in enumerate(estimators):
+                path = os.path.join(tmp_dir, f"estimator_{idx}.onnx")
+                estimator.save_model(path, format="onnx")
+                sessions.append(
+                    ort.InferenceSession(
+                        path,
+                        sess_options=sess_options,
+                        providers=["CPUExecutionProvider"],
+                    )
+                )
+        return sessions
+
+    def _fitted_estimators(self) -> List[CatBoostRegressor]:
+        """The fitted CatBoost estimators, one per output if the model is wrapped in a `MultiOutputRegressor`."""
+        if isinstance(self.model, MultiOutputRegressor):
+            return self.model.estimators_
+        return [self.model]
+
+    def __getstate__(self):
+        # ONNX Runtime sessions cannot be pickled, they are re-created upon the next prediction
+        return {k: v for k, v in self.__dict__.items() if k != "_ort_sessions"}
+
+    def __setstate__(self, d):
+        self.__dict__ = d
+        self._ort_sessions = None
+
+    def _predict_quantile(
+        self,
+        x: np.ndarray,
+        num_samples: int,
+        predict_likelihood_parameters: bool,
+        **kwargs,
+    ) -> np.ndarray:
+        """Override of _LikelihoodMixin's method, supporting a single MultiQuantile model, or the quantile models
+        stored in a list ordered as `self.quantiles`.
+        X is of shape (n_series * n_samples, n_regression_features)
+        """
+        k = x.shape[0]
+
+        if self._multi_quantile:
+            # all the quantiles are predicted in a single call
+            model_output = self.model.predict(x, **kwargs)
+            if model_output.ndim == 3:
+                # `MultiOutputRegressor` stacks the (n_series * n_samples, n_quantiles) outputs of its estimators
+                # with shape (n_quantiles, n_series * n_samples, output_chunk_length * n_components)
+                model_output = model_output.transpose(1, 2, 0)
+            # shape (n_series * n_samples, output_chunk_length, n_components, n_quantiles)
+            model_output = model_output.reshape(
+                k, self.pred_dim, -1, len(self.quantiles)
+            )
+            if num_samples == 1 and not predict_likelihood_parameters:
+                # return median
+                return model_output[..., self._median_idx]
+            return model_output
+
+        # if predict_likelihood_parameters is True, all the quantiles must be predicted
+        if num_samples == 1 and not predict_likelihood_parameters:
+            # return median
+            fitted = self._model_container[self._median_idx]
+            return fitted.predict(x, **kwargs).reshape(k, self.pred_dim, -1)
+
+        model_outputs = []
+        for fitted in self._model_container:
+            self.model = fitted
+            # model output has shape (n_series * n_samples, output_chunk_length, n_components)
+            model_output = fitted.predict(x, **kwargs).reshape(k, self.pred_dim, -1)
+            model_outputs.append(model_output)
+        model_outputs = np.stack(model_outputs, axis=-1)
+        # shape (n_series * n_samples, output_chunk_length, n_components, n_quantiles)
+        return model_outputs
+
     def _likelihood_components_names(
         self, input_series: TimeSeries
     ) -> Optional[List[str]]:
@@ -319,6 +603,10 @@ class CatBoostModel(RegressionModel, _LikelihoodMixin):
     def export_onnx(self, path: Optional[str] = None, **onnx_kwargs) -> None:
         """
         Exports the model as an ONNX file.
+
+        The exported graph consists of an `ai.onnx.ml` tree ensemble operator. ONNX Runtime's (dynamic) INT8
+        quantization only applies to linear-algebra operators such as `MatMul` and `Gemm`, so it leaves this graph
+        unchanged and is therefore not offered here.
         """
         super().check_export_onnx(path, **onnx_kwargs)
         if self.model is None:
@@ -332,7 +620,14 @@ class CatBoostModel(RegressionModel, _LikelihoodMixin):
         if path is None:
             path = f"{self._default_save_path()}.onnx"
 
-        # Jeadie: This doesn;t really work yet. Darts is doing something rather odd, so the catboost
-        # libraries own `.save_model` is returning approx. an empty catboost.
-        self.model.estimator.__setattr__('_random_seed', '42') # This may be a bug with Darts.
-        self.model.estimator.save_model(path, format="onnx") # estimator is underlying catboost model.
+        # export the fitted estimator; for a `MultiOutputRegressor`, `self.model.estimator` is the unfitted template
+        estimators = self._fitted_estimators()
+        if len(estimators) > 1:
+            raise_log(
+                ValueError(
+                    "ONNX export of a CatBoostModel is only supported for a single estimator, but the model has "
+                    f"{len(estimators)} (one per predicted component and step)."
+                ),
+                logger=logger,
+            )
+        estimators[0].save_model(path, format="onnx")
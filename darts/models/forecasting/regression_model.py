@@ -579,7 +579,17 @@ class RegressionModel(GlobalForecastingModel):
             training_labels = training_labels.ravel()
         self.model.fit(training_samples, training_labels, **kwargs)
 
-        # generate and store the lagged components names (for feature importance analysis)
+        self._set_lagged_feature_names(
+            target_series, past_covariates, future_covariates
+        )
+
+    def _set_lagged_feature_names(
+        self,
+        target_series: Sequence[TimeSeries],
+        past_covariates: Sequence[TimeSeries],
+        future_covariates: Sequence[TimeSeries],
+    ):
+        """Generates and stores the lagged components names (for feature importance analysis)."""
         self._lagged_feature_names, _ = create_lagged_component_names(
             target_series=target_series,
             past_covariates=past_covariates,
@@ -688,9 +698,11 @@ class RegressionModel(GlobalForecastingModel):
                         self.model, n_jobs=n_jobs_multioutput_wrapper
                     )
                 elif self.model.__class__.__name__ == "CatBoostRegressor":
+                    # these losses already have a multi-dimensional output for a single target
+                    loss_function = self.model.get_params().get("loss_function", "")
                     if (
-                        self.model.get_params()["loss_function"]
-                        == "RMSEWithUncertainty"
+                        loss_function == "RMSEWithUncertainty"
+                        or loss_function.startswith("MultiQuantile")
                     ):
                         self.model = MultiOutputRegressor(
                             self.model, n_jobs=n_jobs_multioutput_wrapper
@@ -1402,18 +1414,14 @@ class _LikelihoodMixin:
         """
         n_entries, n_samples, n_params = model_output.shape
 
-        # treating each component separately
-        mu_sigma_list = [model_output[i, :, :] for i in range(n_entries)]
-
-        list_of_samples = [
-            self._rng.normal(
-                mu_sigma[:, 0],  # mean vector
-                mu_sigma[:, 1],  # diagonal covariance matrix
-            )
-            for mu_sigma in mu_sigma_list
-        ]
+        # single draw for all the entries, of shape (n_entries, n_samples); the values are drawn in the same
+        # order as when sampling each component separately
+        samples = self._rng.normal(
+            model_output[:, :, 0],  # mean
+            model_output[:, :, 1],  # diagonal covariance matrix
+        )
 
-        samples_transposed = np.array(list_of_samples).transpose()
+        samples_transposed = samples.transpose()
         samples_reshaped = samples_transposed.reshape(n_samples, self.pred_dim, -1)
 
         return samples_reshaped
@@ -1430,14 +1438,10 @@ class _LikelihoodMixin:
 
     def _params_normal(self, model_output: np.ndarray) -> np.ndarray:
         """[mu, sigma] on the last dimension, grouped by component"""
-        shape = model_output.shape
-        n_samples = shape[1]
-
-        # extract mu and sigma for each component
-        mu_sigma_list = [model_output[i, :, :] for i in range(shape[0])]
+        n_samples = model_output.shape[1]
 
         # reshape to (n_samples, output_chunk_length, 2)
-        params_transposed = np.array(mu_sigma_list).transpose()
+        params_transposed = model_output.transpose()
         params_reshaped = params_transposed.reshape(n_samples, self.pred_dim, -1)
         return params_reshaped
 
@@ -1485,7 +1489,7 @@ class _LikelihoodMixin:
     ) -> List[str]:
         return self._likelihood_generate_components_names(
             input_series,
-            [f"q{quantile:.2f}" for quantile in self._model_container.keys()],
+            [f"q{quantile:.2f}" for quantile in self.quantiles],
         )
 
     def _likelihood_generate_components_names(
@@ -1,4 +1,6 @@
+import warnings
 from typing import Sequence
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -17,7 +19,12 @@ from darts.ad.scorers import (
     LaplaceNLLScorer,
 )
 from darts.ad.scorers import NormScorer as Norm
-from darts.ad.scorers import PoissonNLLScorer, PyODScorer, WassersteinScorer
+from darts.ad.scorers import (
+    PoissonNLLScorer,
+    PyODScorer,
+    WassersteinScorer,
+    nll_poisson_scorer,
+)
 from darts.models import MovingAverageFilter
 
 list_NonFittableAnomalyScorer = [
@@ -2426,9 +2433,30 @@ class TestADAnomalyScorer:
                 actual_series=self.test, pred_series=self.probabilistic
             )  # len(self.test)=100
 
-        np.random.seed(4)
         scorer = PoissonNLLScorer()
 
+        # actual values must be non-negative integers
+        distribution_series = TimeSeries.from_values(
+            np.random.poisson(size=10, lam=1).reshape(1, 1, -1)
+        )
+        with pytest.raises(ValueError):
+            scorer.score_from_prediction(
+                TimeSeries.from_values(np.array([-1])), distribution_series
+            )
+        with pytest.raises(ValueError):
+            scorer.score_from_prediction(
+                TimeSeries.from_values(np.array([1.5])), distribution_series
+            )
+
+        # all-zero prediction samples give a finite score for a positive actual value
+        value_zero_pred = scorer.score_from_prediction(
+            TimeSeries.from_values(np.array([2])),
+            TimeSeries.from_values(np.zeros((1, 1, 10))),
+        ).all_values()
+        assert np.all(np.isfinite(value_zero_pred))
+
+        np.random.seed(4)
+
         # test 1 univariate (len=1 and window=1)
         poisson_samples_1 = np.random.poisson(size=10000, lam=1)
         distribution_series = TimeSeries.from_values(
@@ -2570,3 +2598,51 @@ class TestADAnomalyScorer:
         )
 
         assert scorer.is_probabilistic
+
+    def test_PoissonNLLScorer_missing_values(self):
+        # missing actual values give NaN scores, without casting warnings
+        scorer = PoissonNLLScorer()
+        actual_series = TimeSeries.from_values(np.array([2.0, np.nan, 0.0]))
+        distribution_series = TimeSeries.from_values(np.ones((3, 1, 10)))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            scores = (
+                scorer.score_from_prediction(actual_series, distribution_series)
+                .all_values()
+                .flatten()
+            )
+
+        assert np.isnan(scores[1])
+        np.testing.assert_allclose(
+            scores[[0, 2]], -poisson.logpmf([2, 0], mu=1), rtol=1e-10
+        )
+
+    @pytest.mark.parametrize(
+        "numba_available,numexpr_available",
+        [(True, False), (False, True), (False, False)],
+    )
+    def test_PoissonNLLScorer_backends(self, numba_available, numexpr_available):
+        # the Numba kernel, the NumExpr expression and the NumPy fallback all compute the Poisson NLL
+        if numba_available and not nll_poisson_scorer.NUMBA_AVAILABLE:
+            pytest.skip("requires numba")
+        if numexpr_available and not nll_poisson_scorer.NUMEXPR_AVAILABLE:
+            pytest.skip("requires numexpr")
+
+        rng = np.random.default_rng(0)
+        scorer = PoissonNLLScorer()
+        with patch.multiple(
+            nll_poisson_scorer,
+            NUMBA_AVAILABLE=numba_available,
+            NUMEXPR_AVAILABLE=numexpr_available,
+        ):
+            # counts above 255 use Stirling's series in the Numba kernel, and the second call with a larger
+            # maximum count grows the log-factorial table of the other backends
+            for counts in [[0, 1, 7, 255, 256, 300], [0, 3, 1000, 5000]]:
+                vals = np.array(counts, dtype=np.float64)
+                preds = rng.uniform(0.5, 2.0, size=(len(counts), 20)) * (
+                    vals[:, None] + 1
+                )
+                scores = scorer._score_core_nllikelihood(vals, preds)
+                np.testing.assert_allclose(
+                    scores, -poisson.logpmf(vals, mu=preds.mean(axis=1)), rtol=1e-9
+                )
@@ -2,8 +2,11 @@ import copy
 import functools
 import itertools
 import math
+import os
+import pickle
 from unittest.mock import patch
 
+import joblib
 import numpy as np
 import pandas as pd
 import pytest
@@ -36,6 +39,13 @@ logger = get_logger(__name__)
 cb_available = not isinstance(CatBoostModel, NotImportedModule)
 lgbm_available = not isinstance(LightGBMModel, NotImportedModule)
 
+try:
+    import onnxruntime as ort
+
+    ort_available = True
+except ImportError:
+    ort_available = False
+
 
 def train_test_split(series, split_ts):
     """
@@ -2271,6 +2281,216 @@ class TestRegressionModels:
         assert lgb_fit_patch.call_args[1]["eval_set"] is not None
         assert lgb_fit_patch.call_args[1]["early_stopping_rounds"] == 2
 
+        # the training and evaluation features are column-major float32, the labels float32
+        training_samples, training_labels = lgb_fit_patch.call_args[0]
+        eval_samples, eval_labels = lgb_fit_patch.call_args[1]["eval_set"]
+        for samples, labels in [
+            (training_samples, training_labels),
+            (eval_samples, eval_labels),
+        ]:
+            assert samples.dtype == np.float32 and samples.flags.f_contiguous
+            assert labels.dtype == np.float32
+
+    @pytest.mark.skipif(not cb_available, reason="requires catboost")
+    def test_catboost_quantile_models_fitted_in_parallel(self):
+        """Without the MultiQuantile loss, one model per quantile is fitted in a worker process; the quantile models
+        must match models fitted sequentially with the same quantile loss."""
+        quantiles = [0.1, 0.5, 0.9]
+        model_kwargs = {
+            "lags": 3,
+            "output_chunk_length": 2,
+            "iterations": 20,
+            "random_state": 0,
+        }
+        model = CatBoostModel(
+            likelihood="quantile",
+            quantiles=quantiles,
+            multi_quantile=False,
+            **model_kwargs,
+        )
+        assert not model._multi_quantile
+
+        series = self.sine_multivariate1
+        model.fit(series)
+        assert len(model._model_container) == len(quantiles)
+        for quantile_model in model._model_container:
+            assert isinstance(quantile_model, MultiOutputRegressor)
+            assert len(quantile_model.estimators_) == 4
+
+        pred_params = model.predict(n=2, predict_likelihood_parameters=True)
+        for quantile in quantiles:
+            pred_sequential = (
+                CatBoostModel(
+                    loss_function=f"Quantile:alpha={quantile}", **model_kwargs
+                )
+                .fit(series)
+                .predict(n=2)
+            )
+            columns = [f"{comp}_q{quantile:.2f}" for comp in series.components]
+            np.testing.assert_array_equal(
+                pred_params[columns].values(), pred_sequential.values()
+            )
+
+        # refitting and pickling give the same predictions
+        pred_median = model.predict(n=2)
+        model.fit(series)
+        np.testing.assert_array_equal(model.predict(n=2).values(), pred_median.values())
+        model_loaded = pickle.loads(pickle.dumps(model))
+        np.testing.assert_array_equal(
+            model_loaded.predict(n=2, predict_likelihood_parameters=True).values(),
+            pred_params.values(),
+        )
+
+    @pytest.mark.skipif(
+        not (cb_available and darts.models.forecasting.catboost_model.cb_120_or_above),
+        reason="requires catboost >= 1.2",
+    )
+    def test_catboost_multi_quantile(self):
+        """With catboost >= 1.2, all the quantiles are fitted by a single model with the MultiQuantile loss."""
+        quantiles = [0.1, 0.5, 0.9]
+        series = self.sine_multivariate1
+        model = CatBoostModel(
+            lags=3,
+            output_chunk_length=2,
+            likelihood="quantile",
+            quantiles=quantiles,
+            iterations=20,
+            random_state=0,
+        )
+        assert model._multi_quantile
+        model.fit(series)
+        assert model._model_container is None
+        # one estimator per predicted component and step, each predicting all the quantiles
+        assert isinstance(model.model, MultiOutputRegressor)
+        assert len(model.model.estimators_) == 4
+
+        with patch.object(
+            MultiOutputRegressor,
+            "predict",
+            autospec=True,
+            side_effect=MultiOutputRegressor.predict,
+        ) as predict_patch:
+            pred_params = model.predict(n=2, predict_likelihood_parameters=True)
+        x = predict_patch.call_args[0][1]
+
+        # the estimators are ordered by step, then by component
+        for step in range(2):
+            for comp_idx, comp in enumerate(series.components):
+                estimator = model.model.estimators_[step * series.width + comp_idx]
+                expected = estimator.predict(x)[0]
+                for q_idx, quantile in enumerate(quantiles):
+                    np.testing.assert_allclose(
+                        pred_params[f"{comp}_q{quantile:.2f}"].values()[step, 0],
+                        expected[q_idx],
+                    )
+
+    @pytest.mark.skipif(not cb_available, reason="requires catboost")
+    def test_catboost_thread_count(self):
+        # defaults to the number of physical cores, unless given by the user
+        model = CatBoostModel(lags=3)
+        assert model.model.get_params()["thread_count"] == joblib.cpu_count(
+            only_physical_cores=True
+        )
+        model = CatBoostModel(lags=3, thread_count=3)
+        assert model.model.get_params()["thread_count"] == 3
+
+    @pytest.mark.skipif(not cb_available, reason="requires catboost")
+    def test_catboost_predict_task_type(self):
+        with pytest.raises(ValueError):
+            CatBoostModel(lags=3, predict_task_type="TPU")
+
+        cb_regressor = darts.models.forecasting.catboost_model.CatBoostRegressor
+        cb_predict = cb_regressor.predict
+
+        def predict_on_cpu(estimator, data, **kwargs):
+            # the test runs without a GPU
+            kwargs.pop("task_type", None)
+            return cb_predict(estimator, data, **kwargs)
+
+        for predict_task_type, expected_kwargs in [
+            ("GPU", {"task_type": "GPU"}),
+            (None, {}),
+        ]:
+            model = CatBoostModel(
+                lags=3,
+                output_chunk_length=2,
+                iterations=10,
+                predict_task_type=predict_task_type,
+            )
+            model.fit(self.sine_univariate1)
+            with patch.object(
+                cb_regressor, "predict", autospec=True, side_effect=predict_on_cpu
+            ) as predict_patch:
+                model.predict(n=2)
+
+            # the task type is passed to every estimator of the `MultiOutputRegressor`
+            assert isinstance(model.model, MultiOutputRegressor)
+            assert predict_patch.call_count == len(model.model.estimators_) == 2
+            for call in predict_patch.call_args_list:
+                assert call.kwargs == expected_kwargs
+
+    @pytest.mark.skipif(
+        not (cb_available and ort_available), reason="requires catboost and onnxruntime"
+    )
+    @pytest.mark.parametrize("multi_output", [False, True])
+    def test_catboost_onnx_predict(self, multi_output, tmpdir_fn):
+        series = self.sine_multivariate1 if multi_output else self.sine_univariate1
+        model_kwargs = {
+            "lags": 3,
+            "output_chunk_length": 2 if multi_output else 1,
+            "iterations": 20,
+            "random_state": 0,
+        }
+        model_onnx = CatBoostModel(use_onnx_for_predict=True, **model_kwargs)
+        model_onnx.fit(series)
+        model_cb = CatBoostModel(**model_kwargs).fit(series)
+        assert isinstance(model_onnx.model, MultiOutputRegressor) == multi_output
+
+        # auto-regressive prediction, with one session per estimator
+        pred_onnx = model_onnx.predict(n=4)
+        assert len(model_onnx._ort_sessions) == (4 if multi_output else 1)
+        np.testing.assert_allclose(
+            pred_onnx.values(), model_cb.predict(n=4).values(), atol=1e-5
+        )
+
+        # the sessions are re-created after loading the model
+        path = os.path.join(tmpdir_fn, "catboost_onnx.pkl")
+        model_onnx.save(path)
+        model_loaded = CatBoostModel.load(path)
+        assert model_loaded._ort_sessions is None
+        np.testing.assert_array_equal(
+            model_loaded.predict(n=4).values(), pred_onnx.values()
+        )
+
+        # only deterministic models can predict with ONNX Runtime
+        with pytest.raises(ValueError):
+            CatBoostModel(lags=3, likelihood="quantile", use_onnx_for_predict=True)
+
+    @pytest.mark.skipif(
+        not (cb_available and ort_available), reason="requires catboost and onnxruntime"
+    )
+    def test_catboost_export_onnx(self, tmpdir_fn):
+        path = os.path.join(tmpdir_fn, "catboost.onnx")
+        model = CatBoostModel(lags=3, iterations=20, random_state=0)
+        model.fit(self.sine_univariate1)
+        model.export_onnx(path)
+
+        # the fitted estimator is exported
+        x = self.sine_univariate1.values()[-3:].reshape(1, -1).astype(np.float32)
+        session = ort.InferenceSession(path, providers=["CPUExecutionProvider"])
+        pred_onnx = session.run(None, {session.get_inputs()[0].name: x})[0]
+        np.testing.assert_allclose(
+            pred_onnx.ravel(), model.model.predict(x).ravel(), atol=1e-5
+        )
+
+        # a `MultiOutputRegressor` has one estimator per output
+        model = CatBoostModel(
+            lags=3, output_chunk_length=2, iterations=20, random_state=0
+        )
+        model.fit(self.sine_univariate1)
+        with pytest.raises(ValueError):
+            model.export_onnx(path)
+
     @pytest.mark.skipif(not lgbm_available, reason="requires lightgbm")
     def test_quality_forecast_with_categorical_covariates(self):
         """Test case: two time series, a full sine wave series and a sine wave series
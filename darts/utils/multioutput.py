@@ -1,9 +1,10 @@
+import numpy as np
 from sklearn import __version__ as sklearn_version
 from sklearn.base import is_classifier
 from sklearn.multioutput import MultiOutputRegressor as sk_MultiOutputRegressor
 from sklearn.multioutput import _fit_estimator
 from sklearn.utils.multiclass import check_classification_targets
-from sklearn.utils.validation import has_fit_parameter
+from sklearn.utils.validation import check_is_fitted, has_fit_parameter
 
 if sklearn_version >= "1.4":
     # sklearn renamed `_check_fit_params` to `_check_method_params` in v1.4
@@ -23,6 +24,7 @@ class MultiOutputRegressor(sk_MultiOutputRegressor):
     """
     :class:`sklearn.utils.multioutput.MultiOutputRegressor` with a modified ``fit()`` method that also slices
     validation data correctly. The validation data has to be passed as parameter ``eval_set`` in ``**fit_params``.
+    The ``predict()`` method forwards ``**predict_params`` to the ``predict()`` method of each estimator.
     """
 
     def fit(self, X, y, sample_weight=None, **fit_params):
@@ -106,3 +108,30 @@ class MultiOutputRegressor(sk_MultiOutputRegressor):
             self.feature_names_in_ = self.estimators_[0].feature_names_in_
 
         return self
+
+    def predict(self, X, **predict_params):
+        """Predict multi-output variable using model for each target variable.
+
+        Parameters
+        ----------
+        X : {array-like, sparse matrix} of shape (n_samples, n_features)
+            The input data.
+
+        **predict_params : dict of string -> object
+            Parameters passed to the ``estimator.predict`` method of each step.
+
+        Returns
+        -------
+        y : {array-like, sparse matrix} of shape (n_samples, n_outputs)
+            Multi-output targets predicted across multiple predictors.
+            Note: Separate models are generated for each predictor.
+        """
+        check_is_fitted(self)
+        if not hasattr(self.estimators_[0], "predict"):
+            raise ValueError("The base estimator should implement a predict method")
+
+        y = Parallel(n_jobs=self.n_jobs)(
+            delayed(e.predict)(X, **predict_params) for e in self.estimators_
+        )
+
+        return np.asarray(y).T